@@ -16,6 +16,11 @@ class Character:
     dialogue_count: int
     screen_time: float
 
+# Score fields in the order as_array lays them out
+BIAS_FIELDS = ('occupation_gap', 'agency_gap', 'appearance_focus',
+               'relationship_defining', 'dialogue_imbalance',
+               'screen_time_imbalance', 'overall')
+
 @dataclass
 class BiasScores:
     occupation_gap: float
@@ -26,6 +31,15 @@ class BiasScores:
     screen_time_imbalance: float
     overall: float
 
+    def as_array(self) -> np.ndarray:
+        """All scores as one float array ordered like BIAS_FIELDS
+
+        Lets callers stack scores from many movies and reduce them
+        with NumPy instead of reading attributes one by one.
+        """
+        return np.array([getattr(self, field) for field in BIAS_FIELDS],
+                        dtype=np.float32)
+
 class ComprehensiveGenderBiasDetector:
     def __init__(self):
         self.female_names = {
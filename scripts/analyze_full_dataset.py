@@ -1,14 +1,24 @@
+from __future__ import annotations
+
 import json
-import pandas as pd
+import mmap
+import orjson
 import numpy as np
+from datetime import datetime
 from pathlib import Path
 import logging
-from typing import Dict, List, Any
+from typing import Dict, List, Any, TYPE_CHECKING
 import multiprocessing as mp
 from functools import partial
+from operator import itemgetter
 import sys
 import os
 
+if TYPE_CHECKING:
+    # Only for the pd.DataFrame annotations; at runtime pandas is
+    # imported inside the functions that use it
+    import pandas as pd
+
 # Add the models directory to the path
 sys.path.append(os.path.join(os.path.dirname(__file__), '..'))
 
@@ -18,34 +28,113 @@ from models.bias_detection_model import GenderBiasDetectionModel
 logging.basicConfig(level=logging.INFO, format='%(asctime)s - %(levelname)s - %(message)s')
 logger = logging.getLogger(__name__)
 
+# Bias score keys in storage order ('overall' last so column -1 can drive sorting)
+BIAS_SCORE_KEYS = ('occupation_gap', 'agency_gap', 'appearance_focus',
+                   'relationship_defining', 'dialogue_imbalance',
+                   'screen_time_imbalance', 'overall')
+
+# Pulls all seven scores out of a bias_scores dict in one C-level call
+_BIAS_GETTER = itemgetter(*BIAS_SCORE_KEYS)
+
+# Per-process model instance, built once by the pool initializer so tasks
+# don't re-pickle the whole model (or the analyzer) on every dispatch
+_WORKER_MODEL = None
+
+# Movie list visible to workers: inherited copy-on-write under fork (set in the
+# parent before the pool starts), or shipped once per worker via initargs under
+# spawn. Tasks then carry only an integer index instead of the movie payload.
+_WORKER_MOVIES = None
+
+def _init_worker(movies=None):
+    global _WORKER_MODEL, _WORKER_MOVIES
+    _WORKER_MODEL = GenderBiasDetectionModel()
+    if movies is not None:
+        _WORKER_MOVIES = movies
+
+def _tag_professional_flags(result):
+    """Cache per-movie professional-representation flags on a fresh analysis result
+
+    Computed here, while character_details is hot, so the report builder can sum
+    booleans instead of re-walking every movie's character list.
+    """
+    details = result['characters']['character_details']
+    result['characters']['has_female_prof'] = any(
+        char['gender'] == 'female' and char['profession_count'] > 0 for char in details)
+    result['characters']['has_male_prof'] = any(
+        char['gender'] == 'male' and char['profession_count'] > 0 for char in details)
+    return result
+
+def _analyze_movie(movie_data):
+    """Analyze a single movie in a worker process
+
+    Runs the model call synchronously: analyze_movie is a single opaque
+    entry point, so there are no GIL-releasing sub-steps to overlap with a
+    per-worker thread pool. Revisit if the model ever exposes separate
+    extraction and scoring phases.
+    """
+    try:
+        result = _WORKER_MODEL.analyze_movie(movie_data)
+        return _tag_professional_flags(result) if result else result
+    except Exception as e:
+        logger.error(f"Error analyzing movie {movie_data.get('metadata', {}).get('title', 'Unknown')}: {e}")
+        return None
+
+def _analyze_movie_at(index):
+    """Analyze the movie at an index in the worker's shared movie list"""
+    return _analyze_movie(_WORKER_MOVIES[index])
+
 class FullDatasetAnalyzer:
     """
     Analyzer for the complete Bollywood dataset
     """
-    
+
+    # Consider scores above this threshold as significant bias
+    BIAS_THRESHOLD = 60
+
+    # Minimum combined content length for a movie to be analyzed (matches the
+    # partition written by preprocess_dataset.py)
+    MIN_CONTENT_LENGTH = 500
+
+    # Display names precomputed once instead of replace/title per movie
+    PRETTY_BIAS_NAMES = {key: key.replace('_', ' ').title()
+                         for key in BIAS_SCORE_KEYS if key != 'overall'}
+
     def __init__(self, processed_data_path: str = "processed_data"):
         self.processed_data_path = Path(processed_data_path)
         self.model = GenderBiasDetectionModel()
         self.results = []
+        self.summary_df = None
+        self.prefiltered = False
         
         # Create output directory
         self.output_dir = Path("analysis_results")
         self.output_dir.mkdir(exist_ok=True)
     
     def load_processed_data(self) -> List[Dict[str, Any]]:
-        """Load preprocessed movie data"""
+        """Load preprocessed movie data, preferring the pre-filtered partition"""
+        valid_file = self.processed_data_path / "processed_movies_valid.json"
         data_file = self.processed_data_path / "processed_movies.json"
-        
+
+        if valid_file.exists():
+            data_file = valid_file
+            self.prefiltered = True
+
         if not data_file.exists():
             logger.error(f"Processed data file not found: {data_file}")
             logger.error("Please run preprocess_dataset.py first")
             return []
         
         logger.info(f"Loading processed data from {data_file}")
-        
-        with open(data_file, 'r', encoding='utf-8') as f:
-            data = json.load(f)
-        
+
+        # orjson over a read-only mmap parses large files several times faster
+        # than stdlib json.load and skips the intermediate str decode
+        with open(data_file, 'rb') as f:
+            mm = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+            try:
+                data = orjson.loads(memoryview(mm))
+            finally:
+                mm.close()
+
         logger.info(f"Loaded {len(data)} movies")
         return data
     
@@ -54,43 +143,74 @@ class FullDatasetAnalyzer:
         try:
             result = self.model.analyze_movie(movie_data)
             if result:
-                logger.info(f"Analyzed: {result['movie_metadata']['title']} ({result['movie_metadata']['year']})")
+                _tag_professional_flags(result)
+                logger.debug(f"Analyzed: {result['movie_metadata']['title']} ({result['movie_metadata']['year']})")
             return result
         except Exception as e:
             logger.error(f"Error analyzing movie {movie_data.get('metadata', {}).get('title', 'Unknown')}: {e}")
             return None
     
-    def analyze_dataset_parallel(self, movies_data: List[Dict[str, Any]], num_processes: int = None) -> List[Dict[str, Any]]:
-        """Analyze dataset using parallel processing"""
+    def filter_valid_movies(self, movies_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Filter to movies with sufficient content, longest first
+
+        Longest-job-first ordering gives the process pool its biggest tasks
+        early, which shrinks the parallel tail when content lengths are skewed.
+        """
+        lengths = np.fromiter(
+            (movie.get('total_content_length', 0) for movie in movies_data),
+            dtype=np.int64, count=len(movies_data)
+        )
+        order = np.argsort(-lengths, kind='stable')
+        if self.prefiltered:
+            # The preprocessing stage already dropped short movies
+            valid_movies = [movies_data[i] for i in order]
+        else:
+            valid_movies = [movies_data[i] for i in order if lengths[i] > self.MIN_CONTENT_LENGTH]
+
+        logger.info(f"Analyzing {len(valid_movies)} movies with sufficient content")
+        return valid_movies
+
+    def analyze_dataset_parallel(self, valid_movies: List[Dict[str, Any]], num_processes: int = None) -> List[Dict[str, Any]]:
+        """Analyze pre-filtered movies using parallel processing"""
         if num_processes is None:
             num_processes = min(mp.cpu_count(), 8)  # Use up to 8 processes
-        
+
         logger.info(f"Starting parallel analysis with {num_processes} processes")
-        
-        # Filter movies with sufficient content
-        valid_movies = [movie for movie in movies_data 
-                       if movie.get('total_content_length', 0) > 500]
-        
-        logger.info(f"Analyzing {len(valid_movies)} movies with sufficient content")
-        
-        # Use multiprocessing for parallel analysis
-        with mp.Pool(processes=num_processes) as pool:
-            results = pool.map(self.analyze_single_movie, valid_movies)
-        
-        # Filter out None results
-        valid_results = [result for result in results if result is not None]
-        
+
+        # Chunked imap_unordered keeps IPC overhead low and lets us stream
+        # results to disk as they arrive instead of materializing pool.map output
+        chunksize = max(1, len(valid_movies) // (num_processes * 4))
+        stream_path = self.output_dir / 'analysis_results_stream.jsonl'
+
+        # Publish the movie list module-globally so forked workers inherit it
+        # copy-on-write and only 8-byte indices cross the pipe per task; spawn
+        # workers get one copy up front through initargs instead
+        global _WORKER_MOVIES
+        _WORKER_MOVIES = valid_movies
+        initargs = () if mp.get_start_method() == 'fork' else (valid_movies,)
+
+        valid_results = []
+        done = 0
+        with mp.Pool(processes=num_processes, initializer=_init_worker, initargs=initargs) as pool, \
+                open(stream_path, 'w', encoding='utf-8') as stream:
+            for result in pool.imap_unordered(_analyze_movie_at, range(len(valid_movies)), chunksize=chunksize):
+                done += 1
+                if done % 50 == 0:
+                    logger.info(f"Analyzed {done}/{len(valid_movies)} movies")
+                if result is None:
+                    continue
+                valid_results.append(result)
+                stream.write(json.dumps(result, default=str, ensure_ascii=False))
+                stream.write('\n')
+
         logger.info(f"Successfully analyzed {len(valid_results)} movies")
         return valid_results
     
-    def analyze_dataset_sequential(self, movies_data: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
-        """Analyze dataset sequentially (fallback for debugging)"""
+    def analyze_dataset_sequential(self, valid_movies: List[Dict[str, Any]]) -> List[Dict[str, Any]]:
+        """Analyze pre-filtered movies sequentially (fallback for debugging)"""
         logger.info("Starting sequential analysis")
-        
+
         results = []
-        valid_movies = [movie for movie in movies_data 
-                       if movie.get('total_content_length', 0) > 500]
-        
         for i, movie_data in enumerate(valid_movies):
             try:
                 result = self.analyze_single_movie(movie_data)
@@ -106,53 +226,88 @@ class FullDatasetAnalyzer:
         
         return results
     
+    def build_summary_dataframe(self, analysis_results: List[Dict[str, Any]]) -> pd.DataFrame:
+        """Build the per-movie summary DataFrame shared by the grouped analyses and CSV export"""
+        import pandas as pd
+
+        # json_normalize flattens the nested result dicts in C instead of a
+        # Python loop doing ~15 field lookups per movie
+        flat = pd.json_normalize(analysis_results, sep='_')
+
+        columns = {
+            'movie_metadata_title': 'title',
+            'movie_metadata_year': 'year',
+            'movie_metadata_director': 'director',
+            'movie_metadata_genre': 'genre',
+            'characters_total': 'total_characters',
+            'characters_male': 'male_characters',
+            'characters_female': 'female_characters'
+        }
+        columns.update({f'bias_scores_{key}': key for key in BIAS_SCORE_KEYS})
+        flat = flat.rename(columns=columns)
+        flat['bias_examples_count'] = flat['bias_examples'].str.len()
+        flat['content_sources'] = flat['content_sources'].str.join(',')
+
+        summary_df = flat[list(columns.values()) + ['bias_examples_count', 'content_sources']].copy()
+        years = pd.to_numeric(summary_df['year'], errors='coerce')
+        summary_df['decade'] = (years // 10) * 10
+        return summary_df
+
     def generate_comprehensive_report(self, analysis_results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Generate comprehensive bias analysis report"""
         logger.info("Generating comprehensive report...")
-        
+
+        # Per-movie summary frame used by all grouped analyses (and reused for the CSV export)
+        self.summary_df = self.build_summary_dataframe(analysis_results)
+
         # Basic statistics
         total_movies = len(analysis_results)
         total_characters = sum(r['characters']['total'] for r in analysis_results)
         total_male_chars = sum(r['characters']['male'] for r in analysis_results)
         total_female_chars = sum(r['characters']['female'] for r in analysis_results)
         
-        # Bias score statistics
-        bias_scores = {
-            'occupation_gap': [r['bias_scores']['occupation_gap'] for r in analysis_results],
-            'agency_gap': [r['bias_scores']['agency_gap'] for r in analysis_results],
-            'appearance_focus': [r['bias_scores']['appearance_focus'] for r in analysis_results],
-            'relationship_defining': [r['bias_scores']['relationship_defining'] for r in analysis_results],
-            'dialogue_imbalance': [r['bias_scores']['dialogue_imbalance'] for r in analysis_results],
-            'screen_time_imbalance': [r['bias_scores']['screen_time_imbalance'] for r in analysis_results],
-            'overall': [r['bias_scores']['overall'] for r in analysis_results]
-        }
-        
-        # Calculate statistics for each bias type
+        # Bias score statistics: one (N, 7) matrix built in a single pass, so all
+        # reductions run vectorized instead of re-walking the result dicts per bias type
+        score_matrix = np.array(
+            [_BIAS_GETTER(r['bias_scores']) for r in analysis_results],
+            dtype=np.float32
+        )
+
+        means = score_matrix.mean(axis=0)
+        stds = score_matrix.std(axis=0)
+        percentiles = np.percentile(score_matrix, [0, 25, 50, 75, 100], axis=0)
+
         bias_statistics = {}
-        for bias_type, scores in bias_scores.items():
+        for i, bias_type in enumerate(BIAS_SCORE_KEYS):
             bias_statistics[bias_type] = {
-                'mean': np.mean(scores),
-                'median': np.median(scores),
-                'std': np.std(scores),
-                'min': np.min(scores),
-                'max': np.max(scores),
-                'percentile_25': np.percentile(scores, 25),
-                'percentile_75': np.percentile(scores, 75)
+                'mean': means[i],
+                'median': percentiles[2, i],
+                'std': stds[i],
+                'min': percentiles[0, i],
+                'max': percentiles[4, i],
+                'percentile_25': percentiles[1, i],
+                'percentile_75': percentiles[3, i]
             }
         
         # Decade analysis
-        decade_analysis = self.analyze_by_decade(analysis_results)
-        
+        decade_analysis = self.analyze_by_decade(self.summary_df)
+
         # Director analysis
-        director_analysis = self.analyze_by_director(analysis_results)
-        
+        director_analysis = self.analyze_by_director(self.summary_df)
+
         # Genre analysis (if available)
-        genre_analysis = self.analyze_by_genre(analysis_results)
-        
-        # Most and least biased movies
-        sorted_by_bias = sorted(analysis_results, key=lambda x: x['bias_scores']['overall'])
-        most_biased = sorted_by_bias[-10:]  # Top 10 most biased
-        least_biased = sorted_by_bias[:10]  # Top 10 least biased
+        genre_analysis = self.analyze_by_genre(self.summary_df)
+        
+        # Most and least biased movies: O(N) partition selection on the overall
+        # column instead of sorting the whole result list for 20 entries
+        overall_col = score_matrix[:, -1]
+        take = min(10, total_movies)
+        low_idx = np.argpartition(overall_col, take - 1)[:take]
+        low_idx = low_idx[np.argsort(overall_col[low_idx], kind='stable')]
+        high_idx = np.argpartition(overall_col, total_movies - take)[-take:]
+        high_idx = high_idx[np.argsort(overall_col[high_idx], kind='stable')]
+        most_biased = [analysis_results[i] for i in high_idx]  # Top 10 most biased
+        least_biased = [analysis_results[i] for i in low_idx]  # Top 10 least biased
         
         # Bias examples summary
         all_bias_examples = []
@@ -180,7 +335,7 @@ class FullDatasetAnalyzer:
                 'male_characters': total_male_chars,
                 'female_characters': total_female_chars,
                 'gender_ratio': f"{total_male_chars}:{total_female_chars}",
-                'analysis_date': pd.Timestamp.now().isoformat()
+                'analysis_date': datetime.now().isoformat()
             },
             'bias_statistics': bias_statistics,
             'decade_trends': decade_analysis,
@@ -215,156 +370,112 @@ class FullDatasetAnalyzer:
         
         return report
     
-    def analyze_by_decade(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+    def analyze_by_decade(self, summary_df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze bias trends by decade"""
-        decade_data = {}
-        
-        for result in results:
-            year = result['movie_metadata'].get('year')
-            if not year:
-                continue
-            
-            decade = (year // 10) * 10
-            decade_key = f"{decade}s"
-            
-            if decade_key not in decade_data:
-                decade_data[decade_key] = []
-            
-            decade_data[decade_key].append(result)
-        
+        grouped = summary_df.groupby('decade')
+        counts = grouped.size()
+        score_means = grouped[list(BIAS_SCORE_KEYS)].mean()
+        char_totals = grouped[['total_characters', 'male_characters', 'female_characters']].sum()
+
         decade_analysis = {}
-        for decade, movies in decade_data.items():
-            if len(movies) < 5:  # Skip decades with too few movies
+        for decade, count in counts.items():
+            if count < 5:  # Skip decades with too few movies
                 continue
-            
-            bias_scores = {
-                'occupation_gap': np.mean([m['bias_scores']['occupation_gap'] for m in movies]),
-                'agency_gap': np.mean([m['bias_scores']['agency_gap'] for m in movies]),
-                'appearance_focus': np.mean([m['bias_scores']['appearance_focus'] for m in movies]),
-                'relationship_defining': np.mean([m['bias_scores']['relationship_defining'] for m in movies]),
-                'dialogue_imbalance': np.mean([m['bias_scores']['dialogue_imbalance'] for m in movies]),
-                'screen_time_imbalance': np.mean([m['bias_scores']['screen_time_imbalance'] for m in movies]),
-                'overall': np.mean([m['bias_scores']['overall'] for m in movies])
-            }
-            
-            decade_analysis[decade] = {
-                'movie_count': len(movies),
-                'bias_scores': bias_scores,
+
+            decade_analysis[f"{int(decade)}s"] = {
+                'movie_count': int(count),
+                'bias_scores': score_means.loc[decade].to_dict(),
                 'character_stats': {
-                    'total_characters': sum(m['characters']['total'] for m in movies),
-                    'male_characters': sum(m['characters']['male'] for m in movies),
-                    'female_characters': sum(m['characters']['female'] for m in movies)
+                    'total_characters': int(char_totals.loc[decade, 'total_characters']),
+                    'male_characters': int(char_totals.loc[decade, 'male_characters']),
+                    'female_characters': int(char_totals.loc[decade, 'female_characters'])
                 }
             }
-        
+
         return decade_analysis
-    
-    def analyze_by_director(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+    def analyze_by_director(self, summary_df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze bias patterns by director"""
-        director_data = {}
-        
-        for result in results:
-            director = result['movie_metadata'].get('director')
-            if not director or director.lower() in ['unknown', 'none', '']:
-                continue
-            
-            if director not in director_data:
-                director_data[director] = []
-            
-            director_data[director].append(result)
-        
-        # Only analyze directors with multiple movies
+        bias_cols = ['occupation_gap', 'agency_gap', 'appearance_focus',
+                     'relationship_defining', 'overall']
+
+        directors = summary_df['director'].fillna('').astype(str)
+        valid = summary_df[~directors.str.lower().isin(['unknown', 'none', ''])]
+
+        grouped = valid.groupby('director')
+        counts = grouped.size()
+        score_means = grouped[bias_cols].mean()
+        titles = grouped['title'].agg(list)
+
+        # Only analyze directors with multiple movies; keep the top 20 by overall bias
+        eligible = counts[counts >= 2].index
+        top_directors = score_means.loc[eligible].nlargest(20, 'overall')
+
         director_analysis = {}
-        for director, movies in director_data.items():
-            if len(movies) < 2:
-                continue
-            
-            bias_scores = {
-                'occupation_gap': np.mean([m['bias_scores']['occupation_gap'] for m in movies]),
-                'agency_gap': np.mean([m['bias_scores']['agency_gap'] for m in movies]),
-                'appearance_focus': np.mean([m['bias_scores']['appearance_focus'] for m in movies]),
-                'relationship_defining': np.mean([m['bias_scores']['relationship_defining'] for m in movies]),
-                'overall': np.mean([m['bias_scores']['overall'] for m in movies])
-            }
-            
+        for director, scores in top_directors.iterrows():
             director_analysis[director] = {
-                'movie_count': len(movies),
-                'bias_scores': bias_scores,
-                'movies': [m['movie_metadata']['title'] for m in movies]
+                'movie_count': int(counts[director]),
+                'bias_scores': scores.to_dict(),
+                'movies': titles[director]
             }
-        
-        # Sort by overall bias score
-        sorted_directors = sorted(director_analysis.items(), 
-                                key=lambda x: x[1]['bias_scores']['overall'], 
-                                reverse=True)
-        
-        return dict(sorted_directors[:20])  # Top 20 directors
-    
-    def analyze_by_genre(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
+
+        return director_analysis
+
+    def analyze_by_genre(self, summary_df: pd.DataFrame) -> Dict[str, Any]:
         """Analyze bias patterns by genre"""
-        genre_data = {}
-        
-        for result in results:
-            genre = result['movie_metadata'].get('genre')
-            if not genre or genre.lower() in ['unknown', 'none', '']:
-                continue
-            
-            if genre not in genre_data:
-                genre_data[genre] = []
-            
-            genre_data[genre].append(result)
-        
+        bias_cols = ['occupation_gap', 'agency_gap', 'appearance_focus',
+                     'relationship_defining', 'overall']
+
+        genres = summary_df['genre'].fillna('').astype(str)
+        valid = summary_df[~genres.str.lower().isin(['unknown', 'none', ''])]
+
+        grouped = valid.groupby('genre')
+        counts = grouped.size()
+        score_means = grouped[bias_cols].mean()
+
         genre_analysis = {}
-        for genre, movies in genre_data.items():
-            if len(movies) < 5:  # Skip genres with too few movies
+        for genre, count in counts.items():
+            if count < 5:  # Skip genres with too few movies
                 continue
-            
-            bias_scores = {
-                'occupation_gap': np.mean([m['bias_scores']['occupation_gap'] for m in movies]),
-                'agency_gap': np.mean([m['bias_scores']['agency_gap'] for m in movies]),
-                'appearance_focus': np.mean([m['bias_scores']['appearance_focus'] for m in movies]),
-                'relationship_defining': np.mean([m['bias_scores']['relationship_defining'] for m in movies]),
-                'overall': np.mean([m['bias_scores']['overall'] for m in movies])
-            }
-            
+
             genre_analysis[genre] = {
-                'movie_count': len(movies),
-                'bias_scores': bias_scores
+                'movie_count': int(count),
+                'bias_scores': score_means.loc[genre].to_dict()
             }
-        
+
         return genre_analysis
     
     def analyze_character_representation(self, results: List[Dict[str, Any]]) -> Dict[str, Any]:
         """Analyze character representation patterns"""
         total_movies = len(results)
-        
+
+        # Per-movie character counts as one structured array built in a single pass
+        char_counts = np.fromiter(
+            ((r['characters']['total'], r['characters']['male'], r['characters']['female'])
+             for r in results),
+            dtype=[('total', 'i4'), ('male', 'i4'), ('female', 'i4')],
+            count=total_movies
+        )
+
         # Movies with female protagonists (more female characters than male)
-        female_protagonist_movies = sum(1 for r in results if r['characters']['female'] > r['characters']['male'])
-        
+        female_protagonist_movies = int((char_counts['female'] > char_counts['male']).sum())
+
         # Movies with balanced representation (within 1 character difference)
-        balanced_movies = sum(1 for r in results if abs(r['characters']['female'] - r['characters']['male']) <= 1)
-        
+        balanced_movies = int((np.abs(char_counts['female'] - char_counts['male']) <= 1).sum())
+
         # Average characters per movie
-        avg_total_chars = np.mean([r['characters']['total'] for r in results])
-        avg_male_chars = np.mean([r['characters']['male'] for r in results])
-        avg_female_chars = np.mean([r['characters']['female'] for r in results])
-        
-        # Professional representation
-        movies_with_female_professionals = 0
-        movies_with_male_professionals = 0
-        
-        for result in results:
-            # Check if movie has female characters with professions
-            female_chars_with_professions = sum(1 for char in result['characters']['character_details'] 
-                                              if char['gender'] == 'female' and char['profession_count'] > 0)
-            if female_chars_with_professions > 0:
-                movies_with_female_professionals += 1
-            
-            # Check if movie has male characters with professions
-            male_chars_with_professions = sum(1 for char in result['characters']['character_details'] 
-                                            if char['gender'] == 'male' and char['profession_count'] > 0)
-            if male_chars_with_professions > 0:
-                movies_with_male_professionals += 1
+        avg_total_chars = char_counts['total'].mean()
+        avg_male_chars = char_counts['male'].mean()
+        avg_female_chars = char_counts['female'].mean()
+
+        # Professional representation: flags are cached on each result at analysis
+        # time; tag lazily for any result that predates the cached flags
+        for r in results:
+            if 'has_female_prof' not in r['characters']:
+                _tag_professional_flags(r)
+
+        movies_with_female_professionals = sum(1 for r in results if r['characters']['has_female_prof'])
+        movies_with_male_professionals = sum(1 for r in results if r['characters']['has_male_prof'])
         
         return {
             'total_movies': total_movies,
@@ -387,14 +498,8 @@ class FullDatasetAnalyzer:
     
     def get_main_bias_types(self, bias_scores: Dict[str, float]) -> List[str]:
         """Get the main bias types for a movie (scores above threshold)"""
-        threshold = 60  # Consider scores above 60 as significant bias
-        main_biases = []
-        
-        for bias_type, score in bias_scores.items():
-            if bias_type != 'overall' and score > threshold:
-                main_biases.append(bias_type.replace('_', ' ').title())
-        
-        return main_biases
+        return [pretty for bias_type, pretty in self.PRETTY_BIAS_NAMES.items()
+                if bias_scores.get(bias_type, 0) > self.BIAS_THRESHOLD]
     
     def generate_recommendations(self, bias_statistics: Dict[str, Any], decade_analysis: Dict[str, Any]) -> List[str]:
         """Generate recommendations based on analysis"""
@@ -436,63 +541,64 @@ class FullDatasetAnalyzer:
         
         return recommendations
     
-    def save_results(self, analysis_results: List[Dict[str, Any]], report: Dict[str, Any]) -> None:
+    def save_results(self, analysis_results: List[Dict[str, Any]], report: Dict[str, Any],
+                     write_csv: bool = True) -> None:
         """Save analysis results and report"""
+        import pandas as pd
+
         logger.info("Saving analysis results...")
         
-        # Save detailed results
-        with open(self.output_dir / 'detailed_analysis_results.json', 'w', encoding='utf-8') as f:
-            json.dump(analysis_results, f, indent=2, default=str, ensure_ascii=False)
-        
+        # Save detailed results as JSONL: one compact record per line serializes
+        # far faster than indented json.dump and keeps the file streamable
+        orjson_options = orjson.OPT_SERIALIZE_NUMPY | orjson.OPT_NON_STR_KEYS
+        with open(self.output_dir / 'detailed_analysis_results.jsonl', 'wb') as f:
+            for result in analysis_results:
+                f.write(orjson.dumps(result, default=str, option=orjson_options))
+                f.write(b'\n')
+
         # Save comprehensive report
-        with open(self.output_dir / 'comprehensive_bias_report.json', 'w', encoding='utf-8') as f:
-            json.dump(report, f, indent=2, default=str, ensure_ascii=False)
+        with open(self.output_dir / 'comprehensive_bias_report.json', 'wb') as f:
+            f.write(orjson.dumps(report, default=str, option=orjson_options))
         
-        # Create CSV summary for easy analysis
-        summary_data = []
-        for result in analysis_results:
-            summary_data.append({
-                'title': result['movie_metadata']['title'],
-                'year': result['movie_metadata']['year'],
-                'director': result['movie_metadata']['director'],
-                'genre': result['movie_metadata']['genre'],
-                'total_characters': result['characters']['total'],
-                'male_characters': result['characters']['male'],
-                'female_characters': result['characters']['female'],
-                'occupation_gap_score': result['bias_scores']['occupation_gap'],
-                'agency_gap_score': result['bias_scores']['agency_gap'],
-                'appearance_focus_score': result['bias_scores']['appearance_focus'],
-                'relationship_defining_score': result['bias_scores']['relationship_defining'],
-                'dialogue_imbalance_score': result['bias_scores']['dialogue_imbalance'],
-                'screen_time_imbalance_score': result['bias_scores']['screen_time_imbalance'],
-                'overall_bias_score': result['bias_scores']['overall'],
-                'bias_examples_count': len(result['bias_examples']),
-                'content_sources': ','.join(result['content_sources'])
-            })
-        
-        summary_df = pd.DataFrame(summary_data)
-        summary_df.to_csv(self.output_dir / 'bias_analysis_summary.csv', index=False)
-        
-        # Save bias examples separately
-        all_examples = []
-        for result in analysis_results:
-            for example in result['bias_examples']:
-                all_examples.append({
-                    'movie_title': result['movie_metadata']['title'],
-                    'movie_year': result['movie_metadata']['year'],
-                    'bias_type': example['bias_type'],
-                    'character_name': example['character_name'],
-                    'excerpt': example['excerpt'],
-                    'severity': example['severity'],
-                    'explanation': example['explanation'],
-                    'suggestion': example['suggestion']
-                })
-        
-        examples_df = pd.DataFrame(all_examples)
-        examples_df.to_csv(self.output_dir / 'bias_examples.csv', index=False)
+        # Create CSV summary for easy analysis (reuse the frame built for the report)
+        summary_df = getattr(self, 'summary_df', None)
+        if summary_df is None:
+            summary_df = self.build_summary_dataframe(analysis_results)
+
+        csv_columns = {key: f"{key}_score" for key in BIAS_SCORE_KEYS[:-1]}
+        csv_columns['overall'] = 'overall_bias_score'
+        flat_summary = summary_df.drop(columns=['decade']).rename(columns=csv_columns)
+
+        # Save bias examples separately (record_path explodes the nested example
+        # lists with the movie title/year carried along as meta columns)
+        example_cols = ['movie_title', 'movie_year', 'bias_type', 'character_name',
+                        'excerpt', 'severity', 'explanation', 'suggestion']
+        if any(result['bias_examples'] for result in analysis_results):
+            examples_df = pd.json_normalize(
+                analysis_results, record_path='bias_examples',
+                meta=[['movie_metadata', 'title'], ['movie_metadata', 'year']], sep='_')
+            examples_df['movie_title'] = examples_df.pop('movie_metadata_title')
+            examples_df['movie_year'] = examples_df.pop('movie_metadata_year')
+            examples_df = examples_df.reindex(columns=example_cols)
+        else:
+            examples_df = pd.DataFrame(columns=example_cols)
+
+        # Parquet is the primary format for the flat tables: columnar, typed,
+        # and far faster/smaller to write than text-mode CSV
+        try:
+            flat_summary.to_parquet(self.output_dir / 'bias_analysis_summary.parquet',
+                                    compression='zstd', index=False)
+            examples_df.to_parquet(self.output_dir / 'bias_examples.parquet',
+                                   compression='zstd', index=False)
+        except ImportError as e:
+            logger.warning(f"Parquet output skipped (pyarrow not installed): {e}")
+
+        if write_csv:
+            flat_summary.to_csv(self.output_dir / 'bias_analysis_summary.csv', index=False)
+            examples_df.to_csv(self.output_dir / 'bias_examples.csv', index=False)
         
         logger.info(f"Results saved to {self.output_dir}")
-        logger.info(f"- Detailed results: detailed_analysis_results.json")
+        logger.info(f"- Detailed results: detailed_analysis_results.jsonl")
         logger.info(f"- Comprehensive report: comprehensive_bias_report.json")
         logger.info(f"- Summary CSV: bias_analysis_summary.csv")
         logger.info(f"- Bias examples: bias_examples.csv")
@@ -507,16 +613,19 @@ class FullDatasetAnalyzer:
             logger.error("No data to analyze. Exiting.")
             return
         
+        # Filter once up front; both dispatchers receive the same pre-filtered list
+        valid_movies = self.filter_valid_movies(movies_data)
+
         # Run analysis
         if use_parallel:
             try:
-                analysis_results = self.analyze_dataset_parallel(movies_data)
+                analysis_results = self.analyze_dataset_parallel(valid_movies)
             except Exception as e:
                 logger.error(f"Parallel processing failed: {e}")
                 logger.info("Falling back to sequential processing...")
-                analysis_results = self.analyze_dataset_sequential(movies_data)
+                analysis_results = self.analyze_dataset_sequential(valid_movies)
         else:
-            analysis_results = self.analyze_dataset_sequential(movies_data)
+            analysis_results = self.analyze_dataset_sequential(valid_movies)
         
         if not analysis_results:
             logger.error("No movies were successfully analyzed. Exiting.")
@@ -568,26 +677,31 @@ class FullDatasetAnalyzer:
         
         print("\n" + "="*80)
 
+def run(processed_data_path: str = 'processed_data', use_parallel: bool = True) -> bool:
+    """Programmatic entrypoint, used by run_complete_analysis"""
+    analyzer = FullDatasetAnalyzer(processed_data_path)
+    analyzer.run_full_analysis(use_parallel=use_parallel)
+    return True
+
 def main():
     """Main function to run the full analysis"""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description='Analyze full Bollywood dataset for gender bias')
-    parser.add_argument('--processed_data_path', default='processed_data', 
+    parser.add_argument('--processed_data_path', default='processed_data',
                        help='Path to processed data directory')
-    parser.add_argument('--sequential', action='store_true', 
+    parser.add_argument('--sequential', action='store_true',
                        help='Use sequential processing instead of parallel')
     parser.add_argument('--processes', type=int, default=None,
                        help='Number of processes for parallel processing')
-    
+
     args = parser.parse_args()
-    
+
     # Set up multiprocessing
     if args.processes:
         mp.set_start_method('spawn', force=True)
-    
-    analyzer = FullDatasetAnalyzer(args.processed_data_path)
-    analyzer.run_full_analysis(use_parallel=not args.sequential)
+
+    run(args.processed_data_path, use_parallel=not args.sequential)
 
 if __name__ == "__main__":
     main()
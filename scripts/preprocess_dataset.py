@@ -1,4 +1,5 @@
 import os
+import sys
 import json
 import pandas as pd
 import numpy as np
@@ -75,7 +76,7 @@ class BollywoodDatasetPreprocessor:
             'filename': filename,
             'title': None,
             'year': None,
-            'language': 'hindi',  # Default assumption
+            'language': sys.intern('hindi'),  # Default assumption
             'genre': None,
             'director': None
         }
@@ -118,7 +119,7 @@ class BollywoodDatasetPreprocessor:
             content_lower = content.lower()
             found_genres = [genre for genre in genre_keywords if genre in content_lower]
             if found_genres:
-                metadata['genre'] = found_genres[0]
+                metadata['genre'] = sys.intern(found_genres[0])
         
         return metadata
     
@@ -182,7 +183,7 @@ class BollywoodDatasetPreprocessor:
                     metadata = self.extract_movie_metadata(file_info['name'], cleaned_content)
                     
                     script_data = {
-                        'data_type': 'script',
+                        'data_type': sys.intern('script'),
                         'file_info': file_info,
                         'metadata': metadata,
                         'content': cleaned_content,
@@ -236,7 +237,7 @@ class BollywoodDatasetPreprocessor:
                     metadata = self.extract_movie_metadata(file_info['name'], cleaned_content)
                     
                     wiki_data = {
-                        'data_type': 'wikipedia',
+                        'data_type': sys.intern('wikipedia'),
                         'file_info': file_info,
                         'metadata': metadata,
                         'content': cleaned_content,
@@ -290,7 +291,7 @@ class BollywoodDatasetPreprocessor:
                     metadata = self.extract_movie_metadata(file_info['name'], cleaned_content)
                     
                     trailer_data_item = {
-                        'data_type': 'trailer',
+                        'data_type': sys.intern('trailer'),
                         'file_info': file_info,
                         'metadata': metadata,
                         'content': cleaned_content,
@@ -324,7 +325,7 @@ class BollywoodDatasetPreprocessor:
                     metadata = self.extract_movie_metadata(file_info['name'])
                     
                     image_data_item = {
-                        'data_type': 'image',
+                        'data_type': sys.intern('image'),
                         'file_info': file_info,
                         'metadata': metadata,
                         'image_path': file_info['path']
@@ -443,13 +444,30 @@ class BollywoodDatasetPreprocessor:
         
         return f"{title}_{year}"
     
+    def slim_file_info(self, merged_data: List[Dict[str, Any]]) -> None:
+        """Drop redundant file_info fields before saving (full records live in dataset_structure.json)"""
+        for movie in merged_data:
+            sources = [movie['script'], movie['wikipedia'], movie['trailer']] + movie['images']
+            for item in sources:
+                if item and 'file_info' in item:
+                    item['file_info'] = {'name': item['file_info']['name']}
+
     def save_processed_data(self, merged_data: List[Dict[str, Any]]) -> None:
         """Save processed data to files"""
         logger.info("Saving processed data...")
-        
+
+        # Slim redundant per-file metadata to shrink the JSON output
+        self.slim_file_info(merged_data)
+
         # Save complete processed data
         with open(self.output_dir / 'processed_movies.json', 'w', encoding='utf-8') as f:
             json.dump(merged_data, f, indent=2, default=str, ensure_ascii=False)
+
+        # Also save the partition the analyzer will actually process, so the
+        # analysis stage can load it directly and skip its length filter
+        valid_movies = [m for m in merged_data if m['total_content_length'] > 500]
+        with open(self.output_dir / 'processed_movies_valid.json', 'w', encoding='utf-8') as f:
+            json.dump(valid_movies, f, indent=2, default=str, ensure_ascii=False)
         
         # Create a summary DataFrame
         summary_data = []
@@ -515,21 +533,29 @@ class BollywoodDatasetPreprocessor:
         
         logger.info("Preprocessing completed successfully!")
 
+def run(dataset_path: str) -> bool:
+    """Programmatic entrypoint, used by run_complete_analysis
+
+    Returns False if the dataset path is missing, True on completion.
+    """
+    if not os.path.exists(dataset_path):
+        logger.error(f"Dataset path {dataset_path} does not exist")
+        return False
+
+    preprocessor = BollywoodDatasetPreprocessor(dataset_path)
+    preprocessor.run_preprocessing()
+    return True
+
 def main():
     """Main function to run preprocessing"""
     import argparse
-    
+
     parser = argparse.ArgumentParser(description='Preprocess Bollywood dataset')
     parser.add_argument('dataset_path', help='Path to the Bollywood-Data repository')
-    
+
     args = parser.parse_args()
-    
-    if not os.path.exists(args.dataset_path):
-        logger.error(f"Dataset path {args.dataset_path} does not exist")
-        return
-    
-    preprocessor = BollywoodDatasetPreprocessor(args.dataset_path)
-    preprocessor.run_preprocessing()
+
+    run(args.dataset_path)
 
 if __name__ == "__main__":
     main()
@@ -1,17 +1,22 @@
 import requests
 import json
+from concurrent.futures import ThreadPoolExecutor
 
 def test_bollywood_data_access():
     """Simple test to verify we can access the Bollywood dataset"""
-    
+
     print("Testing Bollywood Dataset Access")
     print("=" * 40)
-    
+
+    # One session for all requests: the TCP+TLS handshake is paid once and
+    # the connection is reused
+    session = requests.Session()
+
     # Test 1: Repository access
     print("1. Testing repository access...")
     try:
         repo_url = "https://api.github.com/repos/BollywoodData/Bollywood-Data"
-        response = requests.get(repo_url)
+        response = session.get(repo_url)
         
         if response.status_code == 200:
             repo_info = response.json()
@@ -30,7 +35,7 @@ def test_bollywood_data_access():
     print("\n2. Checking repository contents...")
     try:
         contents_url = "https://api.github.com/repos/BollywoodData/Bollywood-Data/contents"
-        response = requests.get(contents_url)
+        response = session.get(contents_url)
         
         if response.status_code == 200:
             contents = response.json()
@@ -60,27 +65,34 @@ def test_bollywood_data_access():
     # Test 3: Check specific data folders
     print("\n3. Checking data folders...")
     data_folders = ['scripts-data', 'wikipedia-data', 'trailer-data', 'images-data']
-    
-    for folder in data_folders:
+
+    def check_folder(folder):
         try:
             folder_url = f"https://api.github.com/repos/BollywoodData/Bollywood-Data/contents/{folder}"
-            response = requests.get(folder_url)
-            
-            if response.status_code == 200:
-                folder_contents = response.json()
-                print(f"   ✓ {folder}: {len(folder_contents)} files")
-            else:
-                print(f"   ✗ {folder}: Failed ({response.status_code})")
-                
+            return session.get(folder_url)
         except Exception as e:
-            print(f"   ✗ {folder}: Error - {e}")
+            return e
+
+    # The four checks are independent, so issue them concurrently over the
+    # shared session instead of waiting out each round trip in turn
+    with ThreadPoolExecutor(max_workers=len(data_folders)) as executor:
+        responses = list(executor.map(check_folder, data_folders))
+
+    for folder, response in zip(data_folders, responses):
+        if isinstance(response, Exception):
+            print(f"   ✗ {folder}: Error - {response}")
+        elif response.status_code == 200:
+            folder_contents = response.json()
+            print(f"   ✓ {folder}: {len(folder_contents)} files")
+        else:
+            print(f"   ✗ {folder}: Failed ({response.status_code})")
     
     # Test 4: Try to fetch a sample file
     print("\n4. Testing file content access...")
     try:
         # Try to get README file
         readme_url = "https://raw.githubusercontent.com/BollywoodData/Bollywood-Data/master/README.md"
-        response = requests.get(readme_url)
+        response = session.get(readme_url)
         
         if response.status_code == 200:
             content = response.text
@@ -0,0 +1,17 @@
+"""
+Memoized bias-detection results for repeated test cases
+"""
+
+from functools import lru_cache
+
+@lru_cache(maxsize=256)
+def detect_case(text):
+    """Extract characters and score one test text, cached by the text
+
+    Repeated runs over the same case return the stored result instead
+    of redoing extraction and scoring.
+    """
+    from test_samples._detector import get_detector
+    detector = get_detector()
+    characters = detector.extract_characters_advanced(text)
+    return characters, detector.calculate_comprehensive_bias_scores(characters)
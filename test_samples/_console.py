@@ -0,0 +1,63 @@
+"""
+ASCII console mode for CI logs that cannot render emoji
+"""
+
+import sys
+import threading
+
+# One translation table, applied in a single C-level pass per write:
+# status emoji become bracket tags, decorative ones are dropped
+_EMOJI_TABLE = str.maketrans({
+    '✅': '[OK]',    # ✅
+    '❌': '[FAIL]',  # ❌
+    '⚠': '[WARN]',  # ⚠
+    '\U0001F9E0': '',    # 🧠
+    '✍': '',        # ✍
+    '\U0001F3AC': '',    # 🎬
+    '\U0001F39E': '',    # 🎞
+    '\U0001F4CA': '',    # 📊
+    '\U0001F680': '',    # 🚀
+    '\U0001F3AF': '',    # 🎯
+    '\U0001F4DD': '',    # 📝
+    '\U0001F4FD': '',    # 📽
+    '\U0001F6A8': '',    # 🚨
+    '\U0001F4C1': '',    # 📁
+    '\U0001F527': '',    # 🔧
+    '\U0001F465': '',    # 👥
+    '\U0001F9EA': '',    # 🧪
+    '\U0001F4CB': '',    # 📋
+    '️': ''         # variation selector
+})
+
+class AsciiStdout:
+    """Stdout wrapper that strips emoji from everything written"""
+
+    def __init__(self, stream):
+        self._stream = stream
+
+    def write(self, text):
+        return self._stream.write(text.translate(_EMOJI_TABLE))
+
+    def flush(self):
+        self._stream.flush()
+
+def enable_ascii():
+    """Route stdout through the emoji-stripping wrapper"""
+    if not isinstance(sys.stdout, AsciiStdout):
+        sys.stdout = AsciiStdout(sys.stdout)
+
+class ThreadLocalStdout:
+    """Stdout proxy that routes writes to a per-thread buffer"""
+
+    def __init__(self, default):
+        self._default = default
+        self._local = threading.local()
+
+    def register(self, buffer):
+        self._local.buffer = buffer
+
+    def write(self, text):
+        return getattr(self._local, 'buffer', self._default).write(text)
+
+    def flush(self):
+        getattr(self._local, 'buffer', self._default).flush()
@@ -0,0 +1,25 @@
+"""
+Shared lazily-built detector for the sample test runners
+
+Living in its own module keeps the cache in one place: the runner and
+the case cache import it identically, so the detector is constructed
+exactly once per process however the tests are invoked.
+"""
+
+import threading
+from functools import lru_cache
+
+_detector_lock = threading.Lock()
+
+@lru_cache(maxsize=1)
+def _build_detector():
+    # Imported here so importing this module stays cheap; only callers
+    # that actually use the detector pay for loading the model
+    from models.bias_detection_model import ComprehensiveGenderBiasDetector
+    return ComprehensiveGenderBiasDetector()
+
+def get_detector():
+    """Build the detector once and reuse it across all test functions"""
+    # The lock makes the lazy init safe when tests run on worker threads
+    with _detector_lock:
+        return _build_detector()
@@ -2,6 +2,11 @@
 Expected results for validation - use these to check if your system is working correctly
 """
 
+import sys
+import types
+
+import numpy as np
+
 EXPECTED_RESULTS = {
     
     # Expected results for DDLJ analysis
@@ -13,13 +18,13 @@ EXPECTED_RESULTS = {
             'expected_names': ['Raj', 'Simran', 'Dharamvir', 'Baldev', 'Lajwanti']
         },
         'bias_scores': {
-            'occupation_gap': 60-80,      # High - Simran has no profession
-            'agency_gap': 70-90,          # High - Simran waits and follows
-            'appearance_focus': 40-60,    # Medium - Simran described as beautiful
-            'relationship_defining': 80-95, # High - Simran defined by family
-            'overall': 60-80              # High overall bias
+            'occupation_gap': (60, 80),      # High - Simran has no profession
+            'agency_gap': (70, 90),          # High - Simran waits and follows
+            'appearance_focus': (40, 60),    # Medium - Simran described as beautiful
+            'relationship_defining': (80, 95), # High - Simran defined by family
+            'overall': (60, 80)              # High overall bias
         },
-        'bias_examples_count': 3-5
+        'bias_examples_count': (3, 5)
     },
     
     # Expected results for Queen analysis
@@ -31,13 +36,13 @@ EXPECTED_RESULTS = {
             'expected_names': ['Rani', 'Vijay', 'Vijayalakshmi']
         },
         'bias_scores': {
-            'occupation_gap': 20-40,      # Low-Medium - Rani works, starts business
-            'agency_gap': 10-30,          # Low - Rani makes decisions, becomes independent
-            'appearance_focus': 10-30,    # Low - Focus on character growth
-            'relationship_defining': 30-50, # Medium - Initially defined by engagement
-            'overall': 20-40              # Low-Medium overall bias
+            'occupation_gap': (20, 40),      # Low-Medium - Rani works, starts business
+            'agency_gap': (10, 30),          # Low - Rani makes decisions, becomes independent
+            'appearance_focus': (10, 30),    # Low - Focus on character growth
+            'relationship_defining': (30, 50), # Medium - Initially defined by engagement
+            'overall': (20, 40)              # Low-Medium overall bias
         },
-        'bias_examples_count': 1-3
+        'bias_examples_count': (1, 3)
     },
     
     # Expected results for Dangal analysis
@@ -49,13 +54,13 @@ EXPECTED_RESULTS = {
             'expected_names': ['Mahavir', 'Geeta', 'Babita', 'Pramod']
         },
         'bias_scores': {
-            'occupation_gap': 10-30,      # Low - Both daughters are professional wrestlers
-            'agency_gap': 20-40,          # Low-Medium - Daughters make career decisions
-            'appearance_focus': 5-20,     # Very Low - Focus on athletic ability
-            'relationship_defining': 15-35, # Low - Defined by sport, not just family
-            'overall': 15-35              # Low overall bias
+            'occupation_gap': (10, 30),      # Low - Both daughters are professional wrestlers
+            'agency_gap': (20, 40),          # Low-Medium - Daughters make career decisions
+            'appearance_focus': (5, 20),     # Very Low - Focus on athletic ability
+            'relationship_defining': (15, 35), # Low - Defined by sport, not just family
+            'overall': (15, 35)              # Low overall bias
         },
-        'bias_examples_count': 0-2
+        'bias_examples_count': (0, 2)
     },
     
     # Expected rewrite results
@@ -113,6 +118,17 @@ EXPECTED_RESULTS = {
     }
 }
 
+def _freeze(obj):
+    """Recursively wrap dicts in read-only mapping proxies"""
+    return types.MappingProxyType(
+        {key: _freeze(value) if isinstance(value, dict) else value
+         for key, value in obj.items()})
+
+# Reference data is read-only: freezing it catches accidental mutation
+# by validators and keeps the shared dicts copy-on-write friendly for
+# forked test workers
+EXPECTED_RESULTS = _freeze(EXPECTED_RESULTS)
+
 def validate_results(actual_results, expected_key):
     """Validate actual results against expected results"""
     expected = EXPECTED_RESULTS.get(expected_key, {})
@@ -121,24 +137,45 @@ def validate_results(actual_results, expected_key):
         'failed': [],
         'warnings': []
     }
-    
-    # Add validation logic here based on the expected results
-    # This is a framework for validation - implement specific checks as needed
-    
+
+    expected_scores = expected.get('bias_scores')
+    actual_scores = (actual_results or {}).get('bias_scores', {})
+    if expected_scores:
+        categories = [c for c in expected_scores if c in actual_scores]
+        for category in expected_scores:
+            if category not in actual_scores:
+                validation_report['warnings'].append(f"Missing score: {category}")
+
+        if categories:
+            # One vectorized range check covers every scored category
+            lows = np.array([expected_scores[c][0] for c in categories], dtype=np.float64)
+            highs = np.array([expected_scores[c][1] for c in categories], dtype=np.float64)
+            actual = np.array([actual_scores[c] for c in categories], dtype=np.float64)
+            passed_mask = (actual >= lows) & (actual <= highs)
+            for i in np.flatnonzero(passed_mask):
+                validation_report['passed'].append(categories[i])
+            for i in np.flatnonzero(~passed_mask):
+                validation_report['failed'].append(categories[i])
+
     return validation_report
 
 def print_expected_results():
     """Print expected results for reference"""
-    print("📋 EXPECTED RESULTS REFERENCE")
-    print("=" * 50)
-    
+    # Build the whole report in memory and emit it with one write
+    # instead of one locked stdout call per field
+    lines = ["📋 EXPECTED RESULTS REFERENCE", "=" * 50]
+
     for key, expected in EXPECTED_RESULTS.items():
-        print(f"\n🎯 {key.upper()}:")
-        if isinstance(expected, dict):
+        lines.append(f"\n🎯 {key.upper()}:")
+        if isinstance(expected, types.MappingProxyType):
             for subkey, value in expected.items():
-                print(f"  • {subkey}: {value}")
+                if isinstance(value, types.MappingProxyType):
+                    value = dict(value)
+                lines.append(f"  • {subkey}: {value}")
         else:
-            print(f"  • {expected}")
+            lines.append(f"  • {expected}")
+
+    sys.stdout.write("\n".join(lines) + "\n")
 
 if __name__ == "__main__":
     print_expected_results()
@@ -8,16 +8,45 @@ import sys
 import os
 sys.path.append(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
 
-from models.bias_detection_model import ComprehensiveGenderBiasDetector
+import io
 import json
+import re
+from concurrent.futures import ThreadPoolExecutor
+from dataclasses import dataclass
+from functools import lru_cache
+
+from test_samples._detector import get_detector
+
+@dataclass(slots=True, frozen=True)
+class RewriteResult:
+    """Fixed-layout result of a rule-based rewrite"""
+    original_text: str
+    rewritten_text: str
+    quality_score: float
+    bias_reduction: float
+    improvements: tuple
+
+@lru_cache(maxsize=1)
+def _known_name_re():
+    """Gazetteer of expected character names as one compiled alternation
+
+    Built once from the reference data, it finds every known name in a
+    text in a single pass instead of one search per name.
+    """
+    from test_samples.expected_results import EXPECTED_RESULTS
+    names = {name
+             for expected in EXPECTED_RESULTS.values()
+             for name in expected.get('characters', {}).get('expected_names', [])}
+    return re.compile(r'\b(?:' + '|'.join(
+        sorted(map(re.escape, names), key=len, reverse=True)) + r')\b')
 
 def test_bias_detection():
     """Test the bias detection system"""
     print("🧠 TESTING BIAS DETECTION")
     print("=" * 40)
-    
-    detector = ComprehensiveGenderBiasDetector()
-    
+
+    from test_samples._case_cache import detect_case
+
     test_cases = [
         {
             "text": "Priya Sharma, daughter of businessman Mr. Sharma, is beautiful and waits for her father's decision about her marriage.",
@@ -37,12 +66,9 @@ def test_bias_detection():
         print(f"\n📝 Test Case {i}:")
         print(f"Input: {case['text']}")
         
-        # Extract characters
-        characters = detector.extract_characters_advanced(case['text'])
+        # Extract characters and score them (cached per case text)
+        characters, bias_scores = detect_case(case['text'])
         print(f"Characters found: {[c.name for c in characters]}")
-        
-        # Calculate bias scores
-        bias_scores = detector.calculate_comprehensive_bias_scores(characters)
         print(f"Overall bias score: {bias_scores.overall:.1f}/100")
         print(f"Expected level: {case['expected_level']}")
         
@@ -58,34 +84,71 @@ def test_bias_rewriting():
     
     # Simple rule-based rewriter for testing
     class SimpleRewriter:
+        # One combined keyword scan tags which bias markers the text
+        # contains; the alternation plays the role of a multi-pattern
+        # automaton so every keyword is found in a single pass
+        _KEYWORD_TAGS = {
+            'daughter of': 'occupation_gap',
+            'waits for': 'agency_gap',
+            'beautiful': 'appearance_focus',
+            'gorgeous': 'appearance_focus',
+            'pretty': 'appearance_focus',
+            'scientist': 'profession_present'
+        }
+        _KEYWORD_RE = re.compile('|'.join(
+            re.escape(keyword)
+            for keyword in sorted(_KEYWORD_TAGS, key=len, reverse=True)))
+
+        # Known bias types, interned so membership tests reduce to
+        # pointer-identity hash lookups
+        _KNOWN_TYPES = frozenset(map(sys.intern, [
+            'occupation_gap', 'agency_gap', 'appearance_focus',
+            'relationship_defining', 'dialogue_imbalance',
+            'screen_time_imbalance'
+        ]))
+
+        # Compiled once per class: each bias type shares one pattern scan
+        # instead of separate `in`/replace passes over the text
+        _PATTERNS = {
+            'occupation_gap': re.compile(r'daughter of'),
+            'agency_gap': re.compile(r'waits for')
+        }
+        _REPLACEMENTS = {
+            'occupation_gap': 'a scientist, daughter of',
+            'agency_gap': 'actively seeks'
+        }
+        _IMPROVEMENTS = {
+            'occupation_gap': ['Added professional identity to character introduction',
+                               'Added profession (scientist) to female character'],
+            'agency_gap': ['Converted passive action to active agency']
+        }
+
         def rewrite_text_rule_based(self, text, bias_types):
             rewritten = text
             improvements = []
-            
-            # Add professional identity
-            if 'occupation_gap' in bias_types:
-                if 'daughter of' in text and 'scientist' not in text:
-                    rewritten = rewritten.replace('daughter of', 'a scientist, daughter of')
-                    improvements.append('Added professional identity to character introduction')
-                    improvements.append('Added profession (scientist) to female character')
-            
-            # Convert passive to active
-            if 'agency_gap' in bias_types:
-                if 'waits for' in text:
-                    rewritten = rewritten.replace('waits for', 'actively seeks')
-                    improvements.append('Converted passive action to active agency')
-            
+
+            # Interned frozenset: membership checks below are O(1)
+            # regardless of how many types the caller passes
+            bias_types = frozenset(sys.intern(b) for b in bias_types)
+
+            hits = {self._KEYWORD_TAGS[match.group(0)]
+                    for match in self._KEYWORD_RE.finditer(text)}
+
+            for bias_type, pattern in self._PATTERNS.items():
+                if bias_type not in bias_types or bias_type not in hits:
+                    continue
+                if bias_type == 'occupation_gap' and 'profession_present' in hits:
+                    continue
+                rewritten, count = pattern.subn(self._REPLACEMENTS[bias_type], rewritten)
+                if count:
+                    improvements.extend(self._IMPROVEMENTS[bias_type])
+
             # Calculate quality score
             quality_score = 90.0 if len(improvements) > 1 else 65.0
             bias_reduction = 10.0 if 'scientist' in rewritten else 50.0
-            
-            return type('Result', (), {
-                'original_text': text,
-                'rewritten_text': rewritten,
-                'quality_score': quality_score,
-                'bias_reduction': bias_reduction,
-                'improvements': improvements
-            })()
+
+            return RewriteResult(text, rewritten, quality_score,
+                                 bias_reduction, tuple(improvements))
     
     rewriter = SimpleRewriter()
     
@@ -119,8 +182,8 @@ def test_movie_analysis():
     print("\n🎬 TESTING MOVIE ANALYSIS")
     print("=" * 40)
     
-    detector = ComprehensiveGenderBiasDetector()
-    
+    detector = get_detector()
+
     # Sample movie script
     sample_script = """
     DILWALE DULHANIA LE JAYENGE
@@ -153,14 +216,48 @@ def test_movie_analysis():
         print(f"Overall bias score: {result['bias_scores']['overall']:.1f}/100")
         print(f"Bias examples found: {len([c for c in result['characters'] if c['appearance_descriptions']])}")
         
-        # Find highest bias area
+        # Find highest bias area with one C-level argmax over the
+        # category values instead of a Python key function per item
+        import numpy as np
         bias_scores = result['bias_scores']
-        highest_bias = max(bias_scores.items(), key=lambda x: x[1] if x[0] != 'overall' else 0)
-        print(f"Highest bias area: {highest_bias[0]} ({highest_bias[1]:.1f})")
+        names = [name for name in bias_scores if name != 'overall']
+        values = np.fromiter((bias_scores[name] for name in names), dtype=np.float32)
+        highest = int(values.argmax())
+        print(f"Highest bias area: {names[highest]} ({values[highest]:.1f})")
         
     except Exception as e:
         print(f"❌ Analysis failed: {e}")
 
+def test_movies_batch():
+    """Analyze all sample movies as one batch"""
+    print("\n🎞️ TESTING BATCH MOVIE ANALYSIS")
+    print("=" * 40)
+
+    try:
+        from test_samples.sample_inputs import SAMPLE_MOVIES
+    except ImportError as e:
+        print(f"❌ Could not import sample movies: {e}")
+        return
+
+    # One shared detector serves the whole batch, so each movie pays
+    # only for its own analysis
+    detector = get_detector()
+
+    for movie in SAMPLE_MOVIES:
+        title = movie['metadata']['title']
+        print(f"\n📽️ {title} ({movie['metadata']['year']})")
+        known = sorted({match.group(0)
+                        for match in _known_name_re().finditer(movie['combined_content'])})
+        print(f"  Known cast found: {', '.join(known) if known else 'none'}")
+        try:
+            result = detector.analyze_movie_script(movie['combined_content'], title)
+            summary = result['summary']
+            print(f"  Characters: {summary['total_characters']} "
+                  f"({summary['male_characters']} male / {summary['female_characters']} female)")
+            print(f"  Overall bias score: {result['bias_scores']['overall']:.1f}/100")
+        except Exception as e:
+            print(f"  ❌ Analysis failed: {e}")
+
 def test_report_generation():
     """Test report generation"""
     print("\n📊 TESTING REPORT GENERATION")
@@ -205,10 +302,36 @@ def main():
     print("🚀 BOLLYWOOD BIAS BUSTER - QUICK SYSTEM TEST")
     print("=" * 60)
     
-    test_bias_detection()
-    test_bias_rewriting()
-    test_movie_analysis()
-    test_report_generation()
+    tests = [
+        test_bias_detection,
+        test_bias_rewriting,
+        test_movie_analysis,
+        test_movies_batch,
+        test_report_generation
+    ]
+
+    # The tests share no mutable state beyond the cached detector, so
+    # run them concurrently, capture each one's output in a per-thread
+    # buffer, and print the buffers in the original order
+    from test_samples._console import ThreadLocalStdout
+
+    original_stdout = sys.stdout
+    proxy = ThreadLocalStdout(original_stdout)
+
+    def run_captured(test):
+        buffer = io.StringIO()
+        proxy.register(buffer)
+        test()
+        return buffer.getvalue()
+
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=4) as executor:
+            outputs = list(executor.map(run_captured, tests))
+    finally:
+        sys.stdout = original_stdout
+
+    sys.stdout.write(''.join(outputs))
     
     print("\n" + "=" * 60)
     print("🎯 QUICK TEST SUMMARY")
@@ -219,4 +342,7 @@ def main():
     print("🔧 For detailed evaluation, run: python notebooks/complete_evaluation_notebook.py")
 
 if __name__ == "__main__":
+    if '--ascii' in sys.argv or os.environ.get('NO_EMOJI'):
+        from test_samples._console import enable_ascii
+        enable_ascii()
     main()
@@ -2,6 +2,53 @@
 Step-by-step testing guide with detailed examples
 """
 
+import hashlib
+import io
+import os
+import sys
+from concurrent.futures import ThreadPoolExecutor
+from functools import lru_cache
+from pathlib import Path
+
+import numpy as np
+
+# Generated reports are cached on disk by result hash, so re-running
+# the test over an unchanged analysis skips PDF/HTML rendering
+_REPORT_CACHE_DIR = Path('.report_cache')
+
+def _report_cache_key(analysis_result):
+    """Stable digest of an analysis result for the report cache"""
+    try:
+        import orjson
+        payload = orjson.dumps(analysis_result, option=orjson.OPT_SORT_KEYS, default=str)
+    except ImportError:
+        import json
+        payload = json.dumps(analysis_result, sort_keys=True, default=str).encode()
+    return hashlib.blake2b(payload).hexdigest()
+
+# Extraction results keyed by text digest, so repeated steps on the
+# same text reuse the characters instead of re-running extraction
+_EXTRACT_CACHE = {}
+
+def extract_characters_cached(detector, text):
+    """Extract characters, reusing a cached result for identical text"""
+    key = hashlib.blake2b(text.encode(), digest_size=16).digest()
+    if key not in _EXTRACT_CACHE:
+        _EXTRACT_CACHE[key] = detector.extract_characters_advanced(text)
+    return _EXTRACT_CACHE[key]
+
+@lru_cache(maxsize=1)
+def get_detector():
+    """Build the detector once and reuse it across all steps"""
+    from bias_detection_model import ComprehensiveGenderBiasDetector
+    return ComprehensiveGenderBiasDetector()
+
+@lru_cache(maxsize=1)
+def get_rewriter():
+    """Build the rewriter once and reuse it across steps"""
+    from bias_rewriter import LLMBiasRewriter
+    return LLMBiasRewriter()
+
 def test_step_1_character_extraction():
     """Step 1: Test character extraction"""
     print("STEP 1: CHARACTER EXTRACTION TEST")
@@ -18,10 +65,9 @@ def test_step_1_character_extraction():
     print(sample_text.strip())
     
     try:
-        from bias_detection_model import ComprehensiveGenderBiasDetector
-        detector = ComprehensiveGenderBiasDetector()
-        
-        characters = detector.extract_characters_advanced(sample_text)
+        detector = get_detector()
+
+        characters = extract_characters_cached(detector, sample_text)
         
         print(f"\n👥 Characters detected: {len(characters)}")
         for char in characters:
@@ -48,19 +94,16 @@ def test_step_2_bias_scoring(characters):
         return None
     
     try:
-        from bias_detection_model import ComprehensiveGenderBiasDetector
-        detector = ComprehensiveGenderBiasDetector()
-        
+        from bias_detection_model import BIAS_FIELDS
+        detector = get_detector()
+
         bias_scores = detector.calculate_comprehensive_bias_scores(characters)
-        
+
+        # One array read covers all score fields
         print("📊 Bias Scores:")
-        print(f"  • Occupation Gap: {bias_scores.occupation_gap:.1f}/100")
-        print(f"  • Agency Gap: {bias_scores.agency_gap:.1f}/100")
-        print(f"  • Appearance Focus: {bias_scores.appearance_focus:.1f}/100")
-        print(f"  • Relationship Defining: {bias_scores.relationship_defining:.1f}/100")
-        print(f"  • Dialogue Imbalance: {bias_scores.dialogue_imbalance:.1f}/100")
-        print(f"  • Screen Time Imbalance: {bias_scores.screen_time_imbalance:.1f}/100")
-        print(f"  • OVERALL: {bias_scores.overall:.1f}/100")
+        for name, value in zip(BIAS_FIELDS, bias_scores.as_array()):
+            label = 'OVERALL' if name == 'overall' else name.replace('_', ' ').title()
+            print(f"  • {label}: {value:.1f}/100")
         
         # Interpret results
         level = "High" if bias_scores.overall > 70 else "Medium" if bias_scores.overall > 40 else "Low"
@@ -86,25 +129,28 @@ def test_step_3_rewriting():
     print(f"\n🎯 Bias types to fix: {bias_types}")
     
     try:
-        from bias_rewriter import LLMBiasRewriter
-        rewriter = LLMBiasRewriter()
-        
+        rewriter = get_rewriter()
+
         # Generate multiple rewrites
         rewrites = rewriter.generate_multiple_rewrites(test_text, bias_types, count=3)
         
         print(f"\n✍️ Generated {len(rewrites)} rewrite options:")
-        
+
+        # One vectorized pass converts every quality score to the
+        # 5-point scale and checks it against the target
+        quality_5_point = np.fromiter(
+            (rewrite.quality_score for rewrite in rewrites), dtype=np.float32) * 0.05
+        meets_target = quality_5_point >= 4.0
+
         for i, rewrite in enumerate(rewrites):
             print(f"\n--- Option {i+1} ---")
             print(f"Rewritten: \"{rewrite.rewritten_text}\"")
             print(f"Quality Score: {rewrite.quality_score:.1f}/100")
             print(f"Bias Reduction: {rewrite.bias_reduction_score:.1f}%")
             print(f"Improvements: {rewrite.improvements}")
-            
-            # Quality check
-            quality_5_point = (rewrite.quality_score / 100) * 5
-            quality_status = "✅ MEETS TARGET" if quality_5_point >= 4.0 else "❌ BELOW TARGET"
-            print(f"Quality (5-point): {quality_5_point:.2f}/5 {quality_status}")
+
+            quality_status = "✅ MEETS TARGET" if meets_target[i] else "❌ BELOW TARGET"
+            print(f"Quality (5-point): {quality_5_point[i]:.2f}/5 {quality_status}")
         
         print("\n✅ Rewriting test completed!")
         return rewrites
@@ -141,9 +187,8 @@ def test_step_4_full_movie_analysis():
     print(f"Content length: {sample_movie['total_content_length']} characters")
     
     try:
-        from bias_detection_model import ComprehensiveGenderBiasDetector
-        detector = ComprehensiveGenderBiasDetector()
-        
+        detector = get_detector()
+
         analysis_result = detector.analyze_movie_comprehensive(sample_movie)
         
         if analysis_result:
@@ -194,18 +239,38 @@ def test_step_5_report_generation(analysis_result):
         report_gen = ComprehensiveBiasReportGenerator()
         
         print("📊 Generating reports...")
-        
-        # Generate PDF report
+
+        _REPORT_CACHE_DIR.mkdir(exist_ok=True)
+        key = _report_cache_key(analysis_result)
+
+        # Generate PDF report (skipped when an identical result was
+        # already rendered)
         try:
-            pdf_path = report_gen.generate_movie_report(analysis_result)
-            print(f"✅ PDF Report: {pdf_path}")
+            cached_pdf = _REPORT_CACHE_DIR / f"{key}.pdf"
+            if cached_pdf.exists():
+                print(f"✅ PDF Report (cached): {cached_pdf}")
+            else:
+                pdf_path = report_gen.generate_movie_report(analysis_result)
+                try:
+                    os.link(pdf_path, cached_pdf)
+                except OSError:
+                    pass
+                print(f"✅ PDF Report: {pdf_path}")
         except Exception as e:
             print(f"⚠️ PDF generation failed: {e}")
-        
+
         # Generate HTML report
         try:
-            html_path = report_gen.generate_html_report(analysis_result)
-            print(f"✅ HTML Report: {html_path}")
+            cached_html = _REPORT_CACHE_DIR / f"{key}.html"
+            if cached_html.exists():
+                print(f"✅ HTML Report (cached): {cached_html}")
+            else:
+                html_path = report_gen.generate_html_report(analysis_result)
+                try:
+                    os.link(html_path, cached_html)
+                except OSError:
+                    pass
+                print(f"✅ HTML Report: {html_path}")
         except Exception as e:
             print(f"⚠️ HTML generation failed: {e}")
         
@@ -224,13 +289,32 @@ def run_step_by_step_test():
     
     # Step 2: Bias scoring
     bias_scores = test_step_2_bias_scoring(characters)
-    
-    # Step 3: Rewriting
-    rewrites = test_step_3_rewriting()
-    
-    # Step 4: Full movie analysis
-    analysis_result = test_step_4_full_movie_analysis()
-    
+
+    # Steps 3 and 4 don't depend on each other, so run them
+    # concurrently, capture each one's output in a per-thread buffer,
+    # and print the buffers in step order
+    from _console import ThreadLocalStdout
+
+    original_stdout = sys.stdout
+    proxy = ThreadLocalStdout(original_stdout)
+
+    def run_captured(step):
+        buffer = io.StringIO()
+        proxy.register(buffer)
+        return step(), buffer.getvalue()
+
+    sys.stdout = proxy
+    try:
+        with ThreadPoolExecutor(max_workers=2) as executor:
+            rewrite_future = executor.submit(run_captured, test_step_3_rewriting)
+            analysis_future = executor.submit(run_captured, test_step_4_full_movie_analysis)
+            rewrites, rewrite_output = rewrite_future.result()
+            analysis_result, analysis_output = analysis_future.result()
+    finally:
+        sys.stdout = original_stdout
+
+    sys.stdout.write(rewrite_output + analysis_output)
+
     # Step 5: Report generation
     test_step_5_report_generation(analysis_result)
     
@@ -241,4 +325,7 @@ def run_step_by_step_test():
     print("If most steps show ✅, your system is working correctly!")
 
 if __name__ == "__main__":
+    if '--ascii' in sys.argv or os.environ.get('NO_EMOJI'):
+        from _console import enable_ascii
+        enable_ascii()
     run_step_by_step_test()